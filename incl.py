@@ -1,76 +1,105 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import functools
 import json
 import glob
 import os
 import numpy as np
 import matplotlib.pyplot as plt
 from scipy import optimize
+from scipy.spatial.transform import Rotation
 import pdal
 
 
-def get_pnts(filename):
-    pdal_pipe = [
-        filename,
+# Fixed PDAL pipeline stages, serialized to JSON once at import. Only the
+# filename stages need encoding per call.
+# UTM to SOCS: (1) UTM to ECEF, (2) Inverse POP, (3) Inverse SOP, then sort
+#   Note: SOP is hardcoded here for ATLAS_South-201908
+_UTM_TO_SOCS_STAGES = ",".join(json.dumps(stage) for stage in [
+    {
+        "type":"filters.reprojection",
+        "in_srs":"EPSG:32624",
+        "out_srs":"EPSG:7789"
+    },
+    {
+        "type":"filters.transformation",
+        "matrix":"0.61830666 -0.720011854 0.315086978 2015337.3934507162 0.78593694 0.566442551 -0.247882962 -1585491.7479251158 0.0 0.400906182 0.916119115 5820390.8039255987 0.0 0.0 0.0 1.0",
+        "invert":"true"
+    },
+    {
+        "type":"filters.transformation",
+        "matrix":"0.4560212389547335 -0.8899688924677321 -0.0000078707114301 830.9795317677513 0.8899669318671532 0.4560202157410177 0.0021030973542710 -3931.5277531064141 -0.0018681020196080 -0.0009660617340401 0.9999977884573395 512.8759432302256 0.0 0.0 0.0 1.0",
+        "invert":"true"
+    },
+    {
+        "type":"filters.sort",
+        "dimension":"GpsTime",
+        "order":"ASC"
+    }
+])
+
+_SOCS_TO_UTM_STAGE = json.dumps(
+    {
+        "type":"filters.reprojection",
+        "in_srs":"EPSG:7789",
+        "out_srs":"EPSG:32624"
+    }
+)
+
+
+def _pipeline_json(*stages):
+    # Join already serialized stages into a PDAL pipeline JSON array
+    return "[" + ",".join(stages) + "]"
+
+
+def _las_writer_stage(filename):
+    return json.dumps(
         {
-            "type":"filters.sort",
-            "dimension":"GpsTime"
+            "type":"writers.las",
+            "filename":filename
         }
-    ]
-    p = pdal.Pipeline(json.dumps(pdal_pipe))
+    )
+
+
+def _get_txyz(view, order=None):
+    # Copy out only the dimensions used here (optionally reordered). Field
+    # views would keep PDAL's full multi-dimension point array alive.
+    dims = ('GpsTime', 'X', 'Y', 'Z')
+    if order is None:
+        return tuple(np.ascontiguousarray(view[dim]) for dim in dims)
+
+    return tuple(view[dim][order] for dim in dims)
+
+
+def get_pnts(filename):
+    p = pdal.Pipeline(_pipeline_json(json.dumps(filename)))
     p.validate()
     p.execute()
     arrays = p.arrays
     view = arrays[0]
 
-    t = view['GpsTime']
-    x = view['X']
-    y = view['Y']
-    z = view['Z']
+    # MTA'd scans are normally already in time order, so only pay for a
+    # (stable, like filters.sort) sort when they are not
+    gps_time = view['GpsTime']
+    order = None
+    if np.any(gps_time[1:] < gps_time[:-1]):
+        order = np.argsort(gps_time, kind='stable')
 
-    return t, x, y, z
+    return _get_txyz(view, order)
 
 
 def get_socs(filename):
-    # Convert LAS/LAZ point cloud from UTM to SOCS system:
-    #   (1) UTM to ECEF, (2) Inverse POP, (3) Inverse SOP
-    #   Note: SOP is hardcoded here for ATLAS_South-201908
+    # Convert LAS/LAZ point cloud from UTM to SOCS system
     root, ext = os.path.splitext(filename)
     outfilename = root + "-socs" + ext
-    pdal_pipe = [
-        filename,
-        {
-            "type":"filters.reprojection",
-            "in_srs":"EPSG:32624",
-            "out_srs":"EPSG:7789"
-        },
-        {
-            "type":"filters.transformation",
-            "matrix":"0.61830666 -0.720011854 0.315086978 2015337.3934507162 0.78593694 0.566442551 -0.247882962 -1585491.7479251158 0.0 0.400906182 0.916119115 5820390.8039255987 0.0 0.0 0.0 1.0",
-            "invert":"true"
-        },
-        {
-            "type":"filters.transformation",
-            "matrix":"0.4560212389547335 -0.8899688924677321 -0.0000078707114301 830.9795317677513 0.8899669318671532 0.4560202157410177 0.0021030973542710 -3931.5277531064141 -0.0018681020196080 -0.0009660617340401 0.9999977884573395 512.8759432302256 0.0 0.0 0.0 1.0",
-            "invert":"true"
-        },
-        {
-            "type":"filters.sort",
-            "dimension":"Gpstime",
-            "order":"ASC"
-        },
-        outfilename
-    ]
-    p = pdal.Pipeline(json.dumps(pdal_pipe))
+    pipeline = _pipeline_json(json.dumps(filename), _UTM_TO_SOCS_STAGES,
+                              json.dumps(outfilename))
+    p = pdal.Pipeline(pipeline)
     p.validate()
     p.execute()
     arrays = p.arrays
     view = arrays[0]
 
-    t = view['GpsTime']
-    x = view['X']
-    y = view['Y']
-    z = view['Z']
-
-    return t, x, y, z
+    return _get_txyz(view)
 
 
 def get_incl(filename):
@@ -79,31 +108,58 @@ def get_incl(filename):
     # Remove garbage
     incl = incl[incl[:,0] > 0]
     incl = incl[~np.isnan(incl[:,0])]
-    # Remove duplicates
-    garbage, idx = np.unique(incl[:,0], return_index=True)
-    incl = incl[idx]
-
+    # Remove duplicates. Readings are normally already time-ordered, so only
+    # sort when they are not, then keep the first reading of each time.
+    if np.any(incl[1:,0] < incl[:-1,0]):
+        incl = incl[np.argsort(incl[:,0], kind='stable')]
+    keep = np.empty(len(incl), dtype=bool)
+    keep[:1] = True
+    keep[1:] = incl[1:,0] != incl[:-1,0]
+    incl = incl[keep]
+
+    # Inclinometer precision (~0.001 deg) fits comfortably in float32, which
+    # halves the traffic through the filter and warp. Time stays float64.
     t = incl[:,0]
-    roll = incl[:,1]
-    pitch = incl[:,2]
+    roll = incl[:,1].astype(np.float32)
+    pitch = incl[:,2].astype(np.float32)
 
     return t, roll, pitch
 
 
+@functools.lru_cache(maxsize=8)
+def _blackman_norm(kernel_length):
+    # Normalized Blackman window, built once per kernel length. Read-only,
+    # since every caller shares the cached array.
+    kernel = np.blackman(kernel_length)
+    kernel = kernel / np.sum(kernel)
+    kernel.setflags(write=False)
+    return kernel
+
+
 def filter_incl(incl, kernel_length=101):
+    # A kernel this short is an identity filter
+    if kernel_length <= 1:
+        return incl.copy()
+
     # Blackman window kernel. Default kernel length based on prior work
     # published in Journal of Glaciology.
-    kernel = np.blackman(kernel_length)
-    kernel = kernel / np.sum(kernel)
-    # Pad roll and pitch signals
-    pad_width = np.int(kernel_length/2)
-    start_pad = incl[0:pad_width]
-    start_pad = np.flip(start_pad)
-    start_pad = 2 * np.mean(start_pad[-10:]) - start_pad
-    end_pad = incl[-pad_width:]
-    end_pad = np.flip(end_pad)
-    end_pad = 2 * np.mean(end_pad[0:10]) - end_pad
-    padded_incl = np.hstack((start_pad, incl, end_pad))
+    kernel = _blackman_norm(kernel_length).astype(incl.dtype, copy=False)
+    # Pad roll and pitch signals with point reflections about the mean of the
+    # first/last 10 samples, written straight into one preallocated buffer
+    pad_width = kernel_length // 2
+    n_mean = min(10, pad_width)
+    n = len(incl)
+    if n < pad_width:
+        raise ValueError(
+            "Inclination series has {} samples; filtering with kernel_length={} "
+            "needs at least {}".format(n, kernel_length, pad_width)
+        )
+    padded_incl = np.empty(n + 2*pad_width, dtype=incl.dtype)
+    padded_incl[pad_width:pad_width+n] = incl
+    np.subtract(2 * np.mean(incl[:n_mean]), incl[pad_width-1::-1],
+                out=padded_incl[:pad_width])
+    np.subtract(2 * np.mean(incl[n-n_mean:]), incl[::-1][:pad_width],
+                out=padded_incl[pad_width+n:])
 
     # Filter
     filtered_incl = np.convolve(padded_incl, kernel, mode='valid')
@@ -111,10 +167,20 @@ def filter_incl(incl, kernel_length=101):
     return filtered_incl
 
 
+def _compose_rp(roll, pitch):
+    # Composed (3,3) inclination rotation R_pitch @ R_roll for a single roll
+    # and pitch (deg), i.e. extrinsic rotations about x (roll) then y (pitch).
+    # Only for the rigid case. Rotation is far too slow per reading, so
+    # warp_cloud works from the sines/cosines directly.
+    R = Rotation.from_euler('xy', [roll, pitch], degrees=True).as_matrix()
+
+    return R.astype(np.result_type(roll, pitch), copy=False)
+
+
 def rotate_cloud(x, y, z, roll, pitch, mode):
     if mode == 'center':
         # Grab roll and pitch values at center time
-        center_idx = np.int(len(roll)/2)
+        center_idx = len(roll) // 2
         roll = roll[center_idx]
         pitch = pitch[center_idx]
     elif mode == 'mean':
@@ -122,55 +188,37 @@ def rotate_cloud(x, y, z, roll, pitch, mode):
         pitch = np.mean(pitch)
 
     # Apply single roll and pitch inclination rotation
-    R_roll = np.array([
-        [1, 0, 0],
-        [0, np.cos(np.deg2rad(roll)), -np.sin(np.deg2rad(roll))],
-        [0, np.sin(np.deg2rad(roll)), np.cos(np.deg2rad(roll))]
-    ])
-    R_pitch = np.array([
-        [np.cos(np.deg2rad(pitch)), 0, np.sin(np.deg2rad(pitch))],
-        [0, 1, 0],
-        [-np.sin(np.deg2rad(pitch)), 0, np.cos(np.deg2rad(pitch))],
-    ])
-    xyz_rot = (R_pitch @ R_roll @ np.vstack((x, y, z))).T
-
-    x_rot = xyz_rot[:,0]
-    y_rot = xyz_rot[:,1]
-    z_rot = xyz_rot[:,2]
+    R = _compose_rp(roll, pitch)
+    x_rot = R[0,0]*x + R[0,1]*y + R[0,2]*z
+    y_rot = R[1,0]*x + R[1,1]*y + R[1,2]*z
+    z_rot = R[2,0]*x + R[2,1]*y + R[2,2]*z
 
     return x_rot, y_rot, z_rot
 
 
 def warp_cloud(pt, x, y, z, it, roll, pitch):
-    # Inclination time midpoints for masking
+    # Inclination time midpoints bound the span of points each reading covers
     it_mid = (it[1:] + it[:-1]) / 2
 
-    # Rotate points according to closes inclination time
-    xyz_rot = np.zeros((len(x), 3))
-    for i in range(0, len(it)):
-        # Mask for points closest to current inclination time
-        if i == 0:
-            mask = pt <= it_mid[i]
-        elif i == (len(it) - 1):
-            mask = pt > it_mid[i-1]
-        else:
-            mask = np.logical_and(pt > it_mid[i-1], pt <= it_mid[i])
-        # Apply inclination rotation
-        R_roll = np.array([
-            [1, 0, 0],
-            [0, np.cos(np.deg2rad(roll[i])), -np.sin(np.deg2rad(roll[i]))],
-            [0, np.sin(np.deg2rad(roll[i])), np.cos(np.deg2rad(roll[i]))]
-        ])
-        R_pitch = np.array([
-            [np.cos(np.deg2rad(pitch[i])), 0, np.sin(np.deg2rad(pitch[i]))],
-            [0, 1, 0],
-            [-np.sin(np.deg2rad(pitch[i])), 0, np.cos(np.deg2rad(pitch[i]))],
-        ])
-        xyz_rot[mask,0:3] = (R_pitch @ R_roll @ np.vstack((x[mask], y[mask], z[mask]))).T
-
-    x_rot = xyz_rot[:,0]
-    y_rot = xyz_rot[:,1]
-    z_rot = xyz_rot[:,2]
+    # Index of the closest inclination time for each point. it_mid has M-1
+    # entries, so the indices already lie in [0, M-1] and need no clipping.
+    idx = np.searchsorted(it_mid, pt, side='left')
+
+    # Roll and pitch sines/cosines of the closest inclination reading per point.
+    # Only these four terms are needed, so no (M,3,3) matrix stack is built.
+    roll = np.deg2rad(roll)
+    pitch = np.deg2rad(pitch)
+    cr = np.cos(roll)[idx]
+    sr = np.sin(roll)[idx]
+    cp = np.cos(pitch)[idx]
+    sp = np.sin(pitch)[idx]
+
+    # Rotate points according to closest inclination time. R_pitch @ R_roll is
+    # expanded by hand: roll about x, then pitch about y.
+    y_rot = cr*y - sr*z
+    z_roll = sr*y + cr*z
+    x_rot = cp*x + sp*z_roll
+    z_rot = cp*z_roll - sp*x
 
     return x_rot, y_rot, z_rot
 
@@ -183,14 +231,9 @@ def save_pnts(filename, t, x, y, z):
     out['Y'] = y
     out['Z'] = z
 
-    pdal_pipe = [
-        {
-            "type":"writers.las",
-            "filename":filename
-        }
-    ]
+    pipeline = _pipeline_json(_las_writer_stage(filename))
 
-    p = pdal.Pipeline(json=json.dumps(pdal_pipe), arrays=[out,])
+    p = pdal.Pipeline(json=pipeline, arrays=[out,])
     p.validate()
     p.execute()
 
@@ -203,26 +246,17 @@ def save_utm(filename, t, x, y, z):
     out['Y'] = y
     out['Z'] = z
 
-    pdal_pipe = [
-        {
-            "type":"filters.reprojection",
-            "in_srs":"EPSG:7789",
-            "out_srs":"EPSG:32624"
-        },
-        {
-            "type":"writers.las",
-            "filename":filename
-        }
-    ]
+    pipeline = _pipeline_json(_SOCS_TO_UTM_STAGE, _las_writer_stage(filename))
 
-    p = pdal.Pipeline(json=json.dumps(pdal_pipe), arrays=[out,])
+    p = pdal.Pipeline(json=pipeline, arrays=[out,])
     p.validate()
     p.execute()
 
 
 def get_phi(it, pt, x, y):
-    # Near field points cause odd phi solutions
-    mask = np.sqrt(x**2 + y**2) > 100
+    # Near field points (closer than 100 m) cause odd phi solutions. Compare
+    # squared ranges to skip the sqrt.
+    mask = (x*x + y*y) > 100.0**2
     pt = pt[mask]
     x = x[mask]
     y = y[mask]
@@ -243,13 +277,26 @@ def model(phi, a, c, d):
     return a * np.sin(phi + c) + d
 
 
+def model_jac(phi, a, c, d):
+    # Analytic Jacobian of model with respect to (a, c, d), so curve_fit
+    # does not finite-difference the sine for every parameter
+    phase = phi + c
+    J = np.empty((np.size(phi), 3))
+    J[:,0] = np.sin(phase)
+    J[:,1] = a * np.cos(phase)
+    J[:,2] = 1.0
+
+    return J
+
+
 def fit_model(phi, incl):
     # These initial values don't seem to matter much
     a0 = 0
     c0 = 0
     d0 = 0
 
-    params, params_cov = optimize.curve_fit(model, phi, incl, p0=[a0,c0,d0])
+    params, params_cov = optimize.curve_fit(model, phi, incl, p0=[a0,c0,d0],
+                                            jac=model_jac)
 
     return params
 
@@ -302,45 +349,84 @@ def remove_reg_trend_incl(phi, roll, pitch, reg_phi, reg_roll, reg_pitch):
     roll_params = fit_model(reg_phi, reg_roll)
     pitch_params = fit_model(reg_phi, reg_pitch)
 
-    # Modeled registration roll and pitch at phi values
-    roll_modeled = model(phi, roll_params[0], roll_params[1], roll_params[2])
-    pitch_modeled = model(phi, pitch_params[0], pitch_params[1], pitch_params[2])
+    # Remove modeled trend into new arrays, leaving the caller's roll and
+    # pitch untouched. Each model, a * sin(phi + c) + d, is evaluated in
+    # place in one reused scratch buffer.
+    trend = np.empty_like(phi)
+    removed = []
+    for incl, (a, c, d) in ((roll, roll_params), (pitch, pitch_params)):
+        np.add(phi, c, out=trend)
+        np.sin(trend, out=trend)
+        trend *= a
+        trend += d
+        removed.append(np.subtract(incl, trend, out=np.empty_like(incl)))
 
-    # Remove modeled trend
-    roll -= roll_modeled
-    pitch -= pitch_modeled
+    return removed[0], removed[1]
 
-    return roll, pitch
 
+@functools.lru_cache(maxsize=16)
+def _load_mat(mat_file):
+    # SOP/POP matrices are reused for every scan, so read each file once
+    return np.loadtxt(mat_file, delimiter=" ")
 
-def sop_pop_cloud(x, y, z, mat_file):
-    mat = np.loadtxt(mat_file, delimiter=" ")
-    xyz1 = np.vstack((x, y, z, np.ones(len(x))))
-    xyz_rot = (mat @ xyz1).T
 
-    x_rot = xyz_rot[:,0]
-    y_rot = xyz_rot[:,1]
-    z_rot = xyz_rot[:,2]
+def _affine_cloud(x, y, z, mat):
+    # Apply a 4x4 affine matrix (last row [0, 0, 0, 1]) component-wise so no
+    # homogeneous (4,N) stack or transposed copy is built
+    x_rot = mat[0,0]*x + mat[0,1]*y + mat[0,2]*z + mat[0,3]
+    y_rot = mat[1,0]*x + mat[1,1]*y + mat[1,2]*z + mat[1,3]
+    z_rot = mat[2,0]*x + mat[2,1]*y + mat[2,2]*z + mat[2,3]
 
     return x_rot, y_rot, z_rot
 
 
+def sop_pop_cloud(x, y, z, mat_file):
+    return _affine_cloud(x, y, z, _load_mat(mat_file))
+
+
+def sop_pop_cloud_fused(x, y, z, sop_file, pop_file):
+    # Compose POP @ SOP once so the cloud is transformed in a single pass
+    mat = _load_mat(pop_file) @ _load_mat(sop_file)
+
+    return _affine_cloud(x, y, z, mat)
+
+
 def save_incl(t, roll, pitch, data_dir, root, ext):
     outfilename = data_dir + "/" + root + ext
-    np.savetxt(
-        outfilename,
-        np.column_stack((t, roll, pitch)),
-        "%0.4f",
-        delimiter=',',
-        header="Time,Roll,Pitch"
-    )
+    # Scalars (e.g. a single mean reading) are written as one row
+    t, roll, pitch = np.broadcast_arrays(*np.atleast_1d(t, roll, pitch))
+    n = len(t)
+
+    # Same text as np.savetxt(..., "%0.4f", delimiter=',', header=...), but
+    # each block of rows is formatted by a single string operation rather
+    # than one Python-level format call per row. Rows are staged in one
+    # reused block buffer instead of a full (N,3) column_stack copy.
+    row_fmt = "%0.4f,%0.4f,%0.4f\n"
+    block = 100000
+    rows = np.empty((min(block, n), 3))
+    with open(outfilename, "w") as f:
+        f.write("# Time,Roll,Pitch\n")
+        for i in range(0, n, block):
+            m = min(block, n - i)
+            rows[:m,0] = t[i:i+m]
+            rows[:m,1] = roll[i:i+m]
+            rows[:m,2] = pitch[i:i+m]
+            f.write((row_fmt * m) % tuple(rows[:m].ravel().tolist()))
+
+
+def _filter_roll_pitch(executor, roll, pitch):
+    # Filter pitch on a worker thread while roll is filtered here.
+    # np.convolve releases the GIL, so the two runs overlap.
+    filtered_pitch = executor.submit(filter_incl, pitch)
+    filtered_roll = filter_incl(roll)
+
+    return filtered_roll, filtered_pitch.result()
 
 
 def no_adj(t, x, y, z, georef, sop_file, pop_file, data_dir, root):
     # Save points
     if georef:
-        xg, yg, zg = sop_pop_cloud(x, y, z, sop_file)
-        xg, yg, zg = sop_pop_cloud(xg, yg, zg, pop_file)
+        xg, yg, zg = sop_pop_cloud_fused(x, y, z, sop_file, pop_file)
         outfilename = data_dir + "/" + root + "-utm.laz"
         save_utm(outfilename, t, xg, yg, zg)
     else:
@@ -350,101 +436,126 @@ def no_adj(t, x, y, z, georef, sop_file, pop_file, data_dir, root):
 
 def warp_adj(t, x, y, z, it, roll, pitch, 
              georef, sop_file, pop_file, data_dir, root):
-    # Noise filter
-    filtered_roll = filter_incl(roll)
-    filtered_pitch = filter_incl(pitch)
-
-    # Apply inclination
-    xw, yw, zw = warp_cloud(
-        t, x, y, z,
-        it, filtered_roll, filtered_pitch
-    )
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        # Noise filter
+        filtered_roll, filtered_pitch = _filter_roll_pitch(executor, roll, pitch)
+
+        # Save filtered inclination while the points are warped and saved
+        ext = "-incl-filtered.txt"
+        saved = [
+            executor.submit(save_incl, it, filtered_roll, filtered_pitch,
+                            data_dir, root, ext)
+        ]
+
+        # Apply inclination
+        xw, yw, zw = warp_cloud(
+            t, x, y, z,
+            it, filtered_roll, filtered_pitch
+        )
+
+        # Save warped points
+        if georef:
+            xg, yg, zg = sop_pop_cloud_fused(xw, yw, zw, sop_file, pop_file)
+            outfilename = data_dir + "/" + root + "-warped-utm.laz"
+            save_utm(outfilename, t, xg, yg, zg)
+        else:
+            outfilename = data_dir + "/" + root + "-warped-socs.laz"
+            save_pnts(outfilename, t, xw, yw, zw)
 
-    # Save warped points
-    if georef:
-        xg, yg, zg = sop_pop_cloud(xw, yw, zw, sop_file)
-        xg, yg, zg = sop_pop_cloud(xg, yg, zg, pop_file)
-        outfilename = data_dir + "/" + root + "-warped-utm.laz"
-        save_utm(outfilename, t, xg, yg, zg)
-    else:
-        outfilename = data_dir + "/" + root + "-warped-socs.laz"
-        save_pnts(outfilename, t, xw, yw, zw)
-    
-    # Save filtered inclination
-    ext = "-incl-filtered.txt"
-    save_incl(it, filtered_roll, filtered_pitch, data_dir, root, ext)
+        # Surface any error from the inclination writes
+        for future in saved:
+            future.result()
 
 
 def mr_warp_adj(t, x, y, z, it, roll, pitch,
                 reg_roll, reg_pitch,
                 georef, sop_file, pop_file, data_dir, root):
-    # Remove MSA registration scan mean inclination
-    mr_roll, mr_pitch = remove_reg_mean_incl(roll, pitch, reg_roll, reg_pitch)
-
-    # Noise filter
-    filtered_mr_roll = filter_incl(mr_roll)
-    filtered_mr_pitch = filter_incl(mr_pitch)
-
-    # Apply inclination
-    xw, yw, zw = warp_cloud(
-        t, x, y, z,
-        it, filtered_mr_roll, filtered_mr_pitch
-    )
-
-    # Save warped points
-    if georef:
-        xg, yg, zg = sop_pop_cloud(xw, yw, zw, sop_file)
-        xg, yg, zg = sop_pop_cloud(xg, yg, zg, pop_file)
-        outfilename = data_dir + "/" + root + "-regmeanrem-warped-utm.laz"
-        save_utm(outfilename, t, xg, yg, zg)
-    else:
-        outfilename = data_dir + "/" + root + "-regmeanrem-warped-socs.laz"
-        save_pnts(outfilename, t, xw, yw, zw)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        # Remove MSA registration scan mean inclination
+        mr_roll, mr_pitch = remove_reg_mean_incl(roll, pitch, reg_roll, reg_pitch)
+        ext = "-incl-regmeanrem.txt"
+        saved = [
+            executor.submit(save_incl, it, mr_roll, mr_pitch,
+                            data_dir, root, ext)
+        ]
+
+        # Noise filter
+        filtered_mr_roll, filtered_mr_pitch = _filter_roll_pitch(
+            executor, mr_roll, mr_pitch
+        )
+        ext = "-incl-regmeanrem-filtered.txt"
+        saved.append(
+            executor.submit(save_incl, it, filtered_mr_roll, filtered_mr_pitch,
+                            data_dir, root, ext)
+        )
+
+        # Apply inclination
+        xw, yw, zw = warp_cloud(
+            t, x, y, z,
+            it, filtered_mr_roll, filtered_mr_pitch
+        )
+
+        # Save warped points
+        if georef:
+            xg, yg, zg = sop_pop_cloud_fused(xw, yw, zw, sop_file, pop_file)
+            outfilename = data_dir + "/" + root + "-regmeanrem-warped-utm.laz"
+            save_utm(outfilename, t, xg, yg, zg)
+        else:
+            outfilename = data_dir + "/" + root + "-regmeanrem-warped-socs.laz"
+            save_pnts(outfilename, t, xw, yw, zw)
 
-    # Save modified and filtered modified inclination
-    ext = "-incl-regmeanrem.txt"
-    save_incl(it, mr_roll, mr_pitch, data_dir, root, ext)
-    ext = "-incl-regmeanrem-filtered.txt"
-    save_incl(it, filtered_mr_roll, filtered_mr_pitch, data_dir, root, ext)
+        # Surface any error from the inclination writes
+        for future in saved:
+            future.result()
 
 
 def tr_warp_adj(t, x, y, z, it, phi, roll, pitch,
                 reg_phi, reg_roll, reg_pitch,
                 georef, sop_file, pop_file, data_dir, root):
-    # Remove MSA registration scan inclination cyclical trends
-    tr_roll, tr_pitch = remove_reg_trend_incl(phi, roll, pitch,
-                                              reg_phi, reg_roll, reg_pitch)
-
-    # Noise filter
-    filtered_tr_roll = filter_incl(tr_roll)
-    filtered_tr_pitch = filter_incl(tr_pitch)
-
-    # Apply inclination
-    xw, yw, zw = warp_cloud(
-        t, x, y, z,
-        it, filtered_tr_roll, filtered_tr_pitch
-    )
-    
-    # Save warped points
-    if georef:
-        xg, yg, zg = sop_pop_cloud(xw, yw, zw, sop_file)
-        xg, yg, zg = sop_pop_cloud(xg, yg, zg, pop_file)
-        outfilename = data_dir + "/" + root + "-regtrendrem-warped-utm.laz"
-        save_utm(outfilename, t, xg, yg, zg)
-    else:
-        outfilename = data_dir + "/" + root + "-regtrendrem-warped-socs.laz"
-        save_pnts(outfilename, t, xw, yw, zw)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        # Remove MSA registration scan inclination cyclical trends
+        tr_roll, tr_pitch = remove_reg_trend_incl(phi, roll, pitch,
+                                                  reg_phi, reg_roll, reg_pitch)
+        ext = "-incl-regtrendrem.txt"
+        saved = [
+            executor.submit(save_incl, it, tr_roll, tr_pitch,
+                            data_dir, root, ext)
+        ]
+
+        # Noise filter
+        filtered_tr_roll, filtered_tr_pitch = _filter_roll_pitch(
+            executor, tr_roll, tr_pitch
+        )
+        ext = "-incl-regtrendrem-filtered.txt"
+        saved.append(
+            executor.submit(save_incl, it, filtered_tr_roll, filtered_tr_pitch,
+                            data_dir, root, ext)
+        )
+
+        # Apply inclination
+        xw, yw, zw = warp_cloud(
+            t, x, y, z,
+            it, filtered_tr_roll, filtered_tr_pitch
+        )
+
+        # Save warped points
+        if georef:
+            xg, yg, zg = sop_pop_cloud_fused(xw, yw, zw, sop_file, pop_file)
+            outfilename = data_dir + "/" + root + "-regtrendrem-warped-utm.laz"
+            save_utm(outfilename, t, xg, yg, zg)
+        else:
+            outfilename = data_dir + "/" + root + "-regtrendrem-warped-socs.laz"
+            save_pnts(outfilename, t, xw, yw, zw)
 
-    # Save modified and filtered modified inclination
-    ext = "-incl-regtrendrem.txt"
-    save_incl(it, tr_roll, tr_pitch, data_dir, root, ext)
-    ext = "-incl-regtrendrem-filtered.txt"
-    save_incl(it, filtered_tr_roll, filtered_tr_pitch, data_dir, root, ext)
+        # Surface any error from the inclination writes
+        for future in saved:
+            future.result()
 
 
 def mr_rotate_adj(t, x, y, z, it, roll, pitch,
                   reg_roll, reg_pitch,
-                  georef, sop_file, pop_file, data_dir, root):
+                  georef, sop_file, pop_file, data_dir, root,
+                  save_mr_incl=True):
     # Remove MSA registration scan mean inclination
     mr_roll, mr_pitch = remove_reg_mean_incl(roll, pitch, reg_roll, reg_pitch)
 
@@ -457,16 +568,34 @@ def mr_rotate_adj(t, x, y, z, it, roll, pitch,
 
     # Save rotated points
     if georef:
-        xg, yg, zg = sop_pop_cloud(xr, yr, zr, sop_file)
-        xg, yg, zg = sop_pop_cloud(xg, yg, zg, pop_file)
+        xg, yg, zg = sop_pop_cloud_fused(xr, yr, zr, sop_file, pop_file)
         outfilename = data_dir + "/" + root + "-regmeanrem-meanrotated-utm.laz"
         save_utm(outfilename, t, xg, yg, zg)
     else:
         outfilename = data_dir + "/" + root + "-regmeanrem-meanrotated-socs.laz"
         save_pnts(outfilename, t, xr, yr, zr)
 
-    # Save modified and mean modified inclination
-    ext = "-incl-regmeanrem.txt"
-    save_incl(it, mr_roll, mr_pitch, data_dir, root, ext)
+    # Save modified and mean modified inclination. mr_warp_adj writes the same
+    # -incl-regmeanrem.txt, so callers running both skip it here.
+    if save_mr_incl:
+        ext = "-incl-regmeanrem.txt"
+        save_incl(it, mr_roll, mr_pitch, data_dir, root, ext)
     ext = "-incl-regmeanrem-mean.txt"
-    save_incl(0, mean_mr_roll, mean_mr_pitch, data_dir, root, ext)
\ No newline at end of file
+    save_incl(0, mean_mr_roll, mean_mr_pitch, data_dir, root, ext)
+
+
+def dispatch_all(variants, max_workers=None):
+    # Run independent adjustments, given as (adj_func, args) pairs, in
+    # separate processes. The *_adj functions leave their input arrays
+    # untouched and, as long as only one variant writes each file (see
+    # mr_rotate_adj's save_mr_incl), they can run side by side. Each worker
+    # receives its own pickled copy of the arrays.
+    if not variants:
+        return
+    if max_workers is None:
+        max_workers = len(variants)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(adj, *args) for adj, args in variants]
+        # Re-raise the first failure after all variants have been submitted
+        for future in futures:
+            future.result()
\ No newline at end of file
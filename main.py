@@ -28,60 +28,75 @@ mr_rotate = True
 
 # Georeference to UTM (True) or leave in SOCS (False)
 georef = True
+
+# Run the selected options for each scan in parallel processes (True) or one
+# after another (False). Each process holds its own copy of the scan's points.
+parallel = False
 # ------------------------------------------------------------------------------
 
 
-# Only load or compute once
-if mr_warp or tr_warp or mr_rotate:
-    reg_it, reg_roll, reg_pitch = get_incl(reg_incl_file)
-if tr_warp:
-    reg_t, reg_x, reg_y, reg_z = get_pnts(reg_pnts_file)
-    reg_phi = get_phi(reg_it, reg_t, reg_x, reg_y)
-
-# Cycle through scans
-laz_files = [f for f in os.listdir(data_dir) if f.endswith(".laz")]
-for laz_file in laz_files:
-    gc.collect()
-    
-    # MTA'd, unfiltered LAZ file in SOCS and corresponding inclination file
-    laz_file = data_dir + "/" + laz_file
-    root, _ = os.path.splitext(os.path.basename(laz_file))
-    incl_file = data_dir + "/" + root + "-incl.txt"
-
-    print("Processing {}".format(laz_file))
-
-    # Read in point and inclination data, compute phi
-    t, x, y, z = get_pnts(laz_file)
-    if warp or mr_warp or tr_warp or mr_rotate:
-        it, roll, pitch = get_incl(incl_file)
-    if tr_warp:
-        phi = get_phi(it, t, x, y)
-
-    # ADJUSTMENT OPTIONS:
-    # No point adjustment
-    if no_adjust:
-        no_adj(t, x, y, z,
-               georef, sop_file, pop_file, data_dir, root)
-
-    # Non-rigid warp with inclination
-    if warp:
-        warp_adj(t, x, y, z, it, roll, pitch, 
-                 georef, sop_file, pop_file, data_dir, root)
-
-    # Non-rigid warp after removing mean MSA inclination
-    if mr_warp:
-        mr_warp_adj(t, x, y, z, it, roll, pitch,
-                    reg_roll, reg_pitch,
-                    georef, sop_file, pop_file, data_dir, root)
-
-    # Non-rigid warp after removing MSA cyclical trend
+if __name__ == "__main__":
+    # Only load or compute once
+    if mr_warp or tr_warp or mr_rotate:
+        reg_it, reg_roll, reg_pitch = get_incl(reg_incl_file)
     if tr_warp:
-        tr_warp_adj(t, x, y, z, it, phi, roll, pitch,
-                    reg_phi, reg_roll, reg_pitch,
-                    georef, sop_file, pop_file, data_dir, root)
-
-    # Mean rigid rotation after removing mean MSA inclination
-    if mr_rotate:
-        mr_rotate_adj(t, x, y, z, it, roll, pitch,
-                      reg_roll, reg_pitch,
-                      georef, sop_file, pop_file, data_dir, root)
\ No newline at end of file
+        reg_t, reg_x, reg_y, reg_z = get_pnts(reg_pnts_file)
+        reg_phi = get_phi(reg_it, reg_t, reg_x, reg_y)
+
+    # Cycle through scans
+    laz_files = [f for f in os.listdir(data_dir) if f.endswith(".laz")]
+    for laz_file in laz_files:
+        gc.collect()
+        
+        # MTA'd, unfiltered LAZ file in SOCS and corresponding inclination file
+        laz_file = data_dir + "/" + laz_file
+        root, _ = os.path.splitext(os.path.basename(laz_file))
+        incl_file = data_dir + "/" + root + "-incl.txt"
+
+        print("Processing {}".format(laz_file))
+
+        # Read in point and inclination data, compute phi
+        t, x, y, z = get_pnts(laz_file)
+        if warp or mr_warp or tr_warp or mr_rotate:
+            it, roll, pitch = get_incl(incl_file)
+        if tr_warp:
+            phi = get_phi(it, t, x, y)
+
+        # ADJUSTMENT OPTIONS:
+        variants = []
+
+        # No point adjustment
+        if no_adjust:
+            variants.append((no_adj, (t, x, y, z,
+                                      georef, sop_file, pop_file, data_dir, root)))
+
+        # Non-rigid warp with inclination
+        if warp:
+            variants.append((warp_adj, (t, x, y, z, it, roll, pitch, 
+                                        georef, sop_file, pop_file, data_dir, root)))
+
+        # Non-rigid warp after removing mean MSA inclination
+        if mr_warp:
+            variants.append((mr_warp_adj, (t, x, y, z, it, roll, pitch,
+                                           reg_roll, reg_pitch,
+                                           georef, sop_file, pop_file, data_dir, root)))
+
+        # Non-rigid warp after removing MSA cyclical trend
+        if tr_warp:
+            variants.append((tr_warp_adj, (t, x, y, z, it, phi, roll, pitch,
+                                           reg_phi, reg_roll, reg_pitch,
+                                           georef, sop_file, pop_file, data_dir, root)))
+
+        # Mean rigid rotation after removing mean MSA inclination. The
+        # mean-removed inclination file is already written by mr_warp.
+        if mr_rotate:
+            variants.append((mr_rotate_adj, (t, x, y, z, it, roll, pitch,
+                                             reg_roll, reg_pitch,
+                                             georef, sop_file, pop_file, data_dir, root,
+                                             not mr_warp)))
+
+        if parallel:
+            dispatch_all(variants)
+        else:
+            for adj, args in variants:
+                adj(*args)
\ No newline at end of file